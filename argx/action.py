@@ -1,5 +1,4 @@
 from __future__ import annotations
-import json
 from typing import TYPE_CHECKING, Any, Sequence
 from argparse import (
     Namespace,
@@ -60,6 +59,13 @@ class StoreFalseAction(StoreConstAction):
 
 @add_attribute("show", True)
 class AppendAction(_AppendAction):
+    # The list created by this action in the current parse. argparse copies
+    # the list every time a value is appended, which makes appending n
+    # values O(n^2). We only copy lists that are not created by us (e.g. the
+    # default), and append to our own list in place after that.
+    # Reset by ArgumentParser.parse_known_args() for each parse.
+    _items: list | None = None
+
     def __call__(  # type: ignore[override]
         self,
         parser: ArgumentParser,
@@ -69,13 +75,17 @@ class AppendAction(_AppendAction):
     ) -> None:
         ns, dest = get_ns_dest(namespace, self.dest)
         items = getattr(ns, dest, None)
-        items = copy_items(items)
+        if items is None or items is not self._items:
+            items = self._items = copy_items(items)
         items.append(values)
         setattr(ns, dest, items)
 
 
 @add_attribute("show", True)
 class AppendConstAction(_AppendConstAction):
+    # See AppendAction._items
+    _items: list | None = None
+
     def __call__(  # type: ignore[override]
         self,
         parser: ArgumentParser,
@@ -85,7 +95,8 @@ class AppendConstAction(_AppendConstAction):
     ) -> None:
         ns, dest = get_ns_dest(namespace, self.dest)
         items = getattr(ns, dest, None)
-        items = copy_items(items)
+        if items is None or items is not self._items:
+            items = self._items = copy_items(items)
         items.append(self.const)
         setattr(ns, dest, items)
 
@@ -116,7 +127,8 @@ class ExtendAction(AppendAction):
     ) -> None:
         ns, dest = get_ns_dest(namespace, self.dest)
         items = getattr(ns, dest, None)
-        items = copy_items(items)
+        if items is None or items is not self._items:
+            items = self._items = copy_items(items)
         items.extend(values)
         setattr(ns, dest, items)
 
@@ -124,10 +136,6 @@ class ExtendAction(AppendAction):
 class ClearAppendAction(AppendAction):
     """Append a list of values to the list of values for a given option"""
 
-    def __init__(self, *args, **kwargs):
-        self.received = False
-        super().__init__(*args, **kwargs)
-
     def __call__(  # type: ignore[override]
         self,
         parser: ArgumentParser,
@@ -136,12 +144,13 @@ class ClearAppendAction(AppendAction):
         option_string: str | None = None,
     ) -> None:
         ns, dest = get_ns_dest(namespace, self.dest)
-        if not self.received:
-            items = []
-            self.received = True
+        if self._items is None:
+            # First values received in this parse, clear the initial value
+            items = self._items = []
         else:
             items = getattr(ns, dest, None)
-            items = copy_items(items)
+            if items is not self._items:
+                items = self._items = copy_items(items)
 
         items.append(values)
         setattr(ns, dest, items)
@@ -156,12 +165,13 @@ class ClearExtendAction(ClearAppendAction):
         option_string: str | None = None,
     ) -> None:
         ns, dest = get_ns_dest(namespace, self.dest)
-        if not self.received:
-            items = []
-            self.received = True
+        if self._items is None:
+            # First values received in this parse, clear the initial value
+            items = self._items = []
         else:
             items = getattr(ns, dest, None)
-            items = copy_items(items)
+            if items is not self._items:
+                items = self._items = copy_items(items)
 
         items.extend(values)
         setattr(ns, dest, items)
@@ -177,6 +187,9 @@ class NamespaceAction(_StoreAction):
         values: str | Sequence[Any] | None,
         option_string: str | None = None,
     ) -> None:
+        # Only needed by this action, delay the import
+        import json
+
         ns, dest = get_ns_dest(namespace, self.dest)
         if isinstance(values, str):
             try:
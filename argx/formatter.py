@@ -1,42 +1,46 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Callable, Iterable, List, Tuple
+from itertools import chain
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Tuple
 from argparse import SUPPRESS, Action, HelpFormatter, _SubParsersAction
 from gettext import gettext as _
 
-from .utils import showable
-
 if TYPE_CHECKING:
     from argparse import _MutuallyExclusiveGroup
 
 
+_DEFAULT_RE = re.compile(r"\[(?:no)?default: ")
+_LEADING_SPACE_RE = re.compile(r"\s*")
+
+
 def _wrap_text(text: str, width: int, indent: str = "") -> List[str]:
     """Wrap text to width and keep the indent"""
     import textwrap
 
+    # Reused for all lines, only the subsequent_indent changes
+    wrapper = textwrap.TextWrapper(width, initial_indent=indent)
+
     def _wrap_line(line: str) -> List[str]:
-        leading_space = line[: len(line) - len(line.lstrip())]
-        rest_text = line[len(leading_space) :]
-        if rest_text.startswith("- "):
+        leading_space = _LEADING_SPACE_RE.match(line).group(0)
+        if line.startswith("- ", len(leading_space)):
             leading_space += "  "
-        return textwrap.wrap(
-            line,
-            width,
-            initial_indent=indent,
-            subsequent_indent=leading_space + indent,
-        )
+        wrapper.subsequent_indent = leading_space + indent
+        return wrapper.wrap(line)
 
-    lines = text.splitlines()
-    out = []
-    for line in lines:
-        out.extend(_wrap_line(line))
-    return out
+    return list(chain.from_iterable(map(_wrap_line, text.splitlines())))
 
 
 class ChargedHelpFormatter(HelpFormatter):
     """Help formatter for pyparam"""
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Metavar formatters by (action, default_metavar)
+        self._metavar_formatters: Dict[
+            Tuple[Action, str], Callable[[int], Tuple[str, ...]]
+        ] = {}
+
     def _format_action(self, action: Action) -> str:
         """Skip header for subparsers"""
         if isinstance(action, _SubParsersAction):
@@ -77,15 +81,31 @@ class ChargedHelpFormatter(HelpFormatter):
         action: Action,
         default_metavar: str,
     ) -> Callable[[int], Tuple[str, ...]]:
-        """Format metavar in case there are namespace in it"""
+        """Format metavar in case there are namespace in it
+
+        Cached, since it is requested several times for each action when
+        formatting usage and help.
+        """
+        key = (action, default_metavar)
+        if key in self._metavar_formatters:
+            return self._metavar_formatters[key]
+
         fmt = super()._metavar_formatter(action, default_metavar)
+        formatted: Dict[int, Tuple[str, ...]] = {}
 
         def format(tuple_size):
-            result = fmt(tuple_size)
-            return tuple(
-                r.split(".")[-1] if isinstance(r, str) else r for r in result
-            )
+            if tuple_size not in formatted:
+                result = fmt(tuple_size)
+                # Most metavars have no namespace in it
+                if any(isinstance(r, str) and "." in r for r in result):
+                    result = tuple(
+                        r.rpartition(".")[2] if isinstance(r, str) else r
+                        for r in result
+                    )
+                formatted[tuple_size] = result
+            return formatted[tuple_size]
 
+        self._metavar_formatters[key] = format
         return format
 
     def add_arguments(  # type: ignore[override]
@@ -98,27 +118,26 @@ class ChargedHelpFormatter(HelpFormatter):
         Modify to handle plus.
         """
         for action in actions:
-            if not plus and not showable(action):
-                action.help = SUPPRESS
+            # actions from argparse do not have the show attribute
+            if not plus and not getattr(action, "show", True):
+                continue
 
+            help = action.help
             if (
-                action.help is not SUPPRESS
+                help is not SUPPRESS
                 and action.default is not None
                 and action.default is not SUPPRESS
             ):
-                help = action.help or ""
+                help = help or ""
 
-                if not re.search(r"\[(?:no)?default: ", help):
+                if not _DEFAULT_RE.search(help):
                     sep = "\n" if "\n" in help else " " if help else ""
-                    action.help = (
-                        f"{help}{sep}[default: %(default)s]"
-                    )
+                    help = action.help = f"{help}{sep}[default: %(default)s]"
 
-            if (
-                isinstance(action.help, str)
-                and action.help.rstrip().endswith("[nodefault]")
-            ):
-                action.help = action.help.rstrip()[:-11].rstrip()
+            if isinstance(help, str):
+                stripped = help.rstrip()
+                if stripped.endswith("[nodefault]"):
+                    action.help = stripped[:-11].rstrip()
 
             self.add_argument(action)
 
@@ -1,26 +1,25 @@
 from __future__ import annotations
 
+import builtins
 import sys
-from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Sequence
-from pathlib import Path
+import warnings
+from typing import IO, TYPE_CHECKING, Any, Callable, Sequence
 from gettext import gettext as _
 from argparse import (
     SUPPRESS,
+    Action,
     _SubParsersAction,
     _ArgumentGroup as APArgumentGroup,
     ArgumentParser as APArgumentParser,
     Namespace,
 )
 
-from simpleconf import Config
-
 from . import type_
 from .utils import (
     format_title,
     get_ns_dest,
     import_pyfile,
-    add_attribute,
-    showable,
+    split_dest,
 )
 from .action import (
     StoreAction,
@@ -40,10 +39,63 @@ from .action import (
 from .formatter import ChargedHelpFormatter
 
 if TYPE_CHECKING:
-    from argparse import _ActionT, _FormatterClass
+    from argparse import HelpFormatter, _ActionT, _FormatterClass
+    from diot import Diot
+
+
+# The help options with the most common prefix "-"
+_HELP_FLAGS = ("-h", "--help")
+_HELP_PLUS_FLAGS = ("-h", "--help", "-h+", "--help+")
+# The keys of the configs for the decedents of a parser, in the order of
+# the arguments of ArgumentParser._add_decedents()
+_DECEDENT_KEYS = (
+    "mutually_exclusive_groups",
+    "groups",
+    "namespaces",
+    "arguments",
+    "commands",
+)
+# The actions and types registered for all parsers
+_ACTIONS = {
+    None: StoreAction,
+    "store": StoreAction,
+    "store_const": StoreConstAction,
+    "store_true": StoreTrueAction,
+    "store_false": StoreFalseAction,
+    "append": AppendAction,
+    "append_const": AppendConstAction,
+    "count": CountAction,
+    "extend": ExtendAction,
+    "clear_append": ClearAppendAction,
+    "clear_extend": ClearExtendAction,
+    "ns": NamespaceAction,
+    "namespace": NamespaceAction,
+    "parsers": SubParserAction,
+    "help": HelpAction,
+}
+# The actions owning the lists of their values in a parse
+_APPEND_ACTIONS = (AppendAction, AppendConstAction)
+_TYPES = {
+    "py": type_.py,
+    "json": type_.json,
+    "path": type_.path,
+    "auto": type_.auto,
+}
+
+
+def _load_configs(*configs: dict | str) -> Diot:
+    """Load the configs"""
+    # Delay the import, as most programs do not load configs at all
+    from simpleconf import Config
+
+    return Config.load(*configs)
+
+
+def _without(conf: dict, *keys: str) -> dict:
+    """Get the items of a config except the given keys, without modifying it"""
+    return {key: value for key, value in conf.items() if key not in keys}
 
 
-@add_attribute("level", 0)
 class ArgumentParser(APArgumentParser):
     """Supercharged ArgumentParser for parsing command line strings into
     Python objects."""
@@ -67,6 +119,7 @@ class ArgumentParser(APArgumentParser):
         pre_parse: (
             Callable[[ArgumentParser, Sequence[str], Namespace], None] | None
         ) = None,
+        level: int = 0,
     ) -> None:
         """Create an ArgumentParser
 
@@ -90,6 +143,9 @@ class ArgumentParser(APArgumentParser):
             pre_parse (Callable[[ArgumentParser], None], optional): The
                 function to call before parsing.
                 Added by `argx`.
+            level (int, optional): The level of the parser, 0 for the main
+                parser, 1 for its subparsers, etc.
+                Added by `argx`.
         """
         old_add_help = add_help
         add_help = False
@@ -109,49 +165,48 @@ class ArgumentParser(APArgumentParser):
         }
         if sys.version_info >= (3, 9):  # pragma: no cover
             kwargs["exit_on_error"] = exit_on_error
+        # The namespace groups indexed by their names
+        # Needed before super().__init__() as actions from the parents
+        # are added there
+        self._ns_group_index: dict[str, _NamespaceArgumentGroup] = {}
+        # The actions with dotted dests, shared with the groups like _actions
+        self._dotted_actions: list[Action] = []
+        # The append actions, whose lists are reset for each parse
+        self._append_actions: list[AppendAction | AppendConstAction] = []
         super().__init__(**kwargs)
 
+        self.level = level
         self.exit_on_void = exit_on_void
         self.pre_parse = pre_parse
         self._subparsers_action: _SubParsersAction | None = None
+        # argparse asks for a formatter on every add_argument() call just to
+        # validate the metavar, reuse one for that instead of creating new ones
+        self._validation_formatter: HelpFormatter | None = None
+        self._validating = False
 
         # Register our actions to override argparse's or add new ones
-        self.register("action", None, StoreAction)
-        self.register("action", "store", StoreAction)
-        self.register("action", "store_const", StoreConstAction)
-        self.register("action", "store_true", StoreTrueAction)
-        self.register("action", "store_false", StoreFalseAction)
-        self.register("action", "append", AppendAction)
-        self.register("action", "append_const", AppendConstAction)
-        self.register("action", "count", CountAction)
-        self.register("action", "extend", ExtendAction)
-        self.register("action", "clear_append", ClearAppendAction)
-        self.register("action", "clear_extend", ClearExtendAction)
-        self.register("action", "ns", NamespaceAction)
-        self.register("action", "namespace", NamespaceAction)
-        self.register("action", "parsers", SubParserAction)
-        self.register("action", "help", HelpAction)
-        self.register("type", "py", type_.py)
-        self.register("type", "json", type_.json)
-        self.register("type", "path", Path)
-        self.register("type", "auto", type_.auto)
+        self._registries["action"].update(_ACTIONS)
+        self._registries["type"].update(_TYPES)
 
         # Add help option to support + for more options
         default_prefix = "-" if "-" in self.prefix_chars else self.prefix_chars[0]
+        if default_prefix == "-":
+            help_flags = _HELP_FLAGS
+            help_plus_flags = _HELP_PLUS_FLAGS
+        else:
+            help_flags = (f"{default_prefix}h", f"{default_prefix * 2}help")
+            help_plus_flags = (*help_flags, *(f"{flag}+" for flag in help_flags))
+
         if old_add_help is True:
             self.add_argument(
-                f"{default_prefix}h",
-                f"{default_prefix * 2}help",
+                *help_flags,
                 action="help",
                 default=SUPPRESS,
                 help=_("show help message and exit"),
             )
         elif old_add_help == "+":
             self.add_argument(
-                f"{default_prefix}h",
-                f"{default_prefix * 2}help",
-                f"{default_prefix}h+",
-                f"{default_prefix * 2}help+",
+                *help_plus_flags,
                 action="help",
                 default=SUPPRESS,
                 help=_("show help message (with + to show more options) and exit"),
@@ -164,6 +219,30 @@ class ArgumentParser(APArgumentParser):
             order=-1,
         )
 
+    def add_argument(self, *args, **kwargs) -> Action:
+        """Add an argument to the parser.
+
+        Modify to reuse the formatter used by argparse to validate metavars.
+        """
+        self._validating = True
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            self._validating = False
+
+    def _get_formatter(self) -> HelpFormatter:
+        """Get the formatter.
+
+        A cached formatter is returned for metavar validation in
+        add_argument(), since it does not hold any states for that.
+        """
+        if not self._validating:
+            return super()._get_formatter()
+
+        if self._validation_formatter is None:
+            self._validation_formatter = super()._get_formatter()
+        return self._validation_formatter
+
     def add_subparsers(self, order: int = 99, **kwargs) -> _SubParsersAction:
         """Add subparsers to the parser.
 
@@ -248,8 +327,10 @@ class ArgumentParser(APArgumentParser):
         if args is None:  # pragma: no cover
             # args default to the system args
             args = sys.argv[1:]
-        else:
-            # make sure that args are mutable
+        elif callable(self.pre_parse) or not isinstance(args, (list, tuple)):
+            # make sure that args are mutable for pre_parse, without
+            # touching the passed-in ones, and can be iterated twice.
+            # Otherwise, args are only read, no need to copy them.
             args = list(args)
 
         # default Namespace built from parser defaults
@@ -263,53 +344,55 @@ class ArgumentParser(APArgumentParser):
 
         # @files to keep in the unknown arguments
         files = []
+        # configs from @files to set the default values
+        confs = []
         # arguments passed to super().parse_known_args() for parsing
-        new_args = []
-
-        for arg in args:
-            # no fromfile_prefix_chars or normal argument
-            if (
-                not self.fromfile_prefix_chars
-                or not arg
-                or arg[0] not in self.fromfile_prefix_chars
-            ):
-                new_args.append(arg)
-
-            # fromfile_prefix_chars is set
-            # and arg is not empty
-            # and arg starts with fromfile_prefix_chars
-
-            # @file.txt is special, send it to super().parse_known_args()
-            # for parsing
-            elif arg.endswith(".txt"):
-                new_args.append(arg)
-            # @file.py, @file.json, ...
-            else:
-                if fromfile_keep:
-                    # keep @file in the unknown arguments
-                    files.append(arg)
-
-                if fromfile_parse:
-                    # parse @file to set the default values
-                    conf = arg[1:]
-                    if conf.endswith(".py"):
-                        try:
-                            conf: dict | str = import_pyfile(conf)
-                        except Exception as e:
-                            self.error(f"Cannot import [{conf}]: {e}")
-                    self.set_defaults_from_configs(conf)
+        if not self.fromfile_prefix_chars:
+            # no @file to handle, send the arguments as they are
+            new_args = args
+        else:
+            new_args = []
+            # A tuple for str.startswith()
+            fromfile_prefixes = tuple(self.fromfile_prefix_chars)
+            for arg in args:
+                # normal argument
+                # @file.txt is special, send it to super().parse_known_args()
+                # for parsing
+                if not arg.startswith(fromfile_prefixes) or arg.endswith(".txt"):
+                    new_args.append(arg)
+                # @file.py, @file.json, ...
+                else:
+                    if fromfile_keep:
+                        # keep @file in the unknown arguments
+                        files.append(arg)
+
+                    if fromfile_parse:
+                        # parse @file to set the default values
+                        conf = arg[1:]
+                        if conf.endswith(".py"):
+                            try:
+                                conf: dict | str = import_pyfile(conf)
+                            except Exception as e:
+                                self.error(f"Cannot import [{conf}]: {e}")
+                        confs.append(conf)
+
+            if confs:
+                # Load them all together, later ones take precedence
+                self.set_defaults_from_configs(*confs)
 
         # add any action defaults that aren't present
         # Do this mainly for namespace actions, like "--group.abc"
-        for action in self._actions:
-            if "." not in action.dest:
-                # Leave the normal actions to the super class
-                continue
-
+        # Leave the normal actions to the super class
+        for action in self._dotted_actions:
             ns, last_key = get_ns_dest(namespace, action.dest)
             if not hasattr(ns, last_key):
                 setattr(ns, last_key, action.default)
 
+        # The lists the append actions own are only for this parse,
+        # lists from previous parses may be shared by other namespaces
+        for append_action in self._append_actions:
+            append_action._items = None
+
         parsed_args, argv = super().parse_known_args(new_args, namespace)
         argv = files + argv
         if not argv and not args and self.exit_on_void:
@@ -330,31 +413,31 @@ class ArgumentParser(APArgumentParser):
             optionalize (bool): Whether to make the arguments optional if
                 they are required.
         """
-        conf = Config.load(*configs)
+        self._set_defaults_from_conf(_load_configs(*configs), optionalize)
+
+    def _set_defaults_from_conf(self, conf: dict, optionalize: bool) -> None:
+        """Set default values from a loaded config"""
         for action in self._actions:
             if "." not in action.dest and action.dest in conf:
                 action.default = conf[action.dest]
                 if optionalize:
                     action.required = False
             elif "." in action.dest:
-                parts = action.dest.split(".")
-                try:
-                    cf = conf
-                    for part in parts[:-1]:
-                        cf = cf[part]
-                    action.default = cf[parts[-1]]
+                cf = conf
+                for part in split_dest(action.dest):
+                    # cf could be a value other than a section
+                    if not isinstance(cf, dict) or part not in cf:
+                        break
+                    cf = cf[part]
+                else:
+                    action.default = cf
                     if optionalize:
                         action.required = False
-                except KeyError:
-                    continue
             # see if we need to update subparsers
             if isinstance(action, _SubParsersAction):
                 for name, subparser in action._name_parser_map.items():
-                    if name in conf:
-                        subparser.set_defaults_from_configs(
-                            conf[name],
-                            optionalize=optionalize,
-                        )
+                    if isinstance(conf.get(name), dict):
+                        subparser._set_defaults_from_conf(conf[name], optionalize)
 
     def _add_action(self, action: _ActionT) -> _ActionT:
         """Add an action to the parser.
@@ -370,30 +453,23 @@ class ArgumentParser(APArgumentParser):
 
         # Do not transform the keys for namespace action
         action.dest = action.option_strings[0].lstrip(self.prefix_chars)
-        # Split the destination into a list of keys
-        keys = action.dest.split(".")
-        seq: Iterable[int] = range(len(keys) - 1, 0, -1)
-        # Add --ns, --ns.subns also to their now group
+        # Look for the group of the closest namespace, from the parent
+        # namespace up to the root one
+        # Add --ns, --ns.subns also to their own group
         if isinstance(action, NamespaceAction):
-            seq = [None] + list(seq)
+            prefix = action.dest
+        else:
+            prefix = action.dest.rpartition(".")[0]
 
         group = None
-        for i in seq:
-            ns_key = ".".join(keys[:i])
-
-            for action_group in self._action_groups:
-                if (
-                    isinstance(action_group, _NamespaceArgumentGroup)
-                    and action_group.name == ns_key
-                ):
-                    group = action_group
-                    break
-
+        while prefix:
+            group = self._ns_group_index.get(prefix)
             if group is not None:
                 break
+            prefix = prefix.rpartition(".")[0]
 
         if group is None:
-            group = self.add_namespace(keys[0])
+            group = self.add_namespace(action.dest.partition(".")[0])
 
         return group._add_action(action)
 
@@ -415,19 +491,15 @@ class ArgumentParser(APArgumentParser):
             _NamespaceArgumentGroup: The namespace
         """
         # Check if the namespace already exists
-        for action_group in self._action_groups:
-            if (
-                isinstance(action_group, _NamespaceArgumentGroup)
-                and action_group.name == name
-            ):
-                raise ValueError(f"Namespace '{name}' already exists")
+        if name in self._ns_group_index:
+            raise ValueError(f"Namespace '{name}' already exists")
 
         if title is None:
             title = f"{_('namespace')} <{name}>"
 
-        group = _NamespaceArgumentGroup(self, title, **kwargs)
-        group.name = name
+        group = _NamespaceArgumentGroup(self, title, name=name, **kwargs)
         self._action_groups.append(group)
+        self._ns_group_index[name] = group
         return group
 
     def add_argument_group(self, *args, **kwargs) -> _ArgumentGroup:
@@ -459,21 +531,40 @@ class ArgumentParser(APArgumentParser):
         Modify to handle plus.
         """
         formatter = self._get_formatter()
+        action_groups = sorted(
+            self._action_groups,
+            key=lambda x: (x.order, x.title),
+        )
+
+        # Actions hidden from the help message, without touching their help
+        # so that they can still be shown with plus=True
+        hidden: set[Action] = set()
+        if not plus:
+            # actions from argparse do not have the show attribute
+            hidden.update(
+                action
+                for action in self._actions
+                if not getattr(action, "show", True)
+            )
+            for action_group in action_groups:
+                # groups always have the show attribute (see _ArgumentGroup)
+                if not action_group.show:
+                    hidden.update(action_group._group_actions)
 
         # usage
-        formatter.add_usage(self.usage, self._actions, self._mutually_exclusive_groups)
+        formatter.add_usage(
+            self.usage,
+            [action for action in self._actions if action not in hidden]
+            if hidden
+            else self._actions,
+            self._mutually_exclusive_groups,
+        )
 
         # description
         formatter.add_text(self.description)
         # positionals, optionals and user-defined groups
-        for action_group in sorted(
-            self._action_groups,
-            key=lambda x: (x.order, x.title),
-        ):
-            if not plus and not showable(action_group):
-                for action in action_group._group_actions:
-                    # hide them in usage as well
-                    action.help = SUPPRESS
+        for action_group in action_groups:
+            if not plus and not action_group.show:
                 continue
 
             formatter.start_section(
@@ -494,57 +585,52 @@ class ArgumentParser(APArgumentParser):
 
     def _add_decedents(
         self,
-        mutually_exclusive_groups: list[dict],
-        groups: list[dict],
-        namespaces: list[dict],
-        arguments: list[dict],
-        commands: list[dict],
+        mutually_exclusive_groups: Sequence[dict],
+        groups: Sequence[dict],
+        namespaces: Sequence[dict],
+        arguments: Sequence[dict],
+        commands: Sequence[dict],
     ) -> None:
-        """Add the decedents of the parser"""
+        """Add the decedents of the parser
+
+        The passed-in configs are not modified.
+        """
         # Add the mutually exclusive groups
         for group_args in mutually_exclusive_groups:
-            group_arguments = group_args.pop("arguments", [])
-            mgroup = self.add_mutually_exclusive_group(**group_args)
-            for argument in group_arguments:
-                flags = argument.pop("flags", [])
-                mgroup.add_argument(*flags, **argument)
+            mgroup = self.add_mutually_exclusive_group(
+                **_without(group_args, "arguments")
+            )
+            for argument in group_args.get("arguments", ()):
+                mgroup.add_argument(
+                    *argument.get("flags", ()),
+                    **_without(argument, "flags"),
+                )
 
         # Add the groups
         for group_args in groups:
-            group_arguments = group_args.pop("arguments", [])
-            group = self.add_argument_group(**group_args)
-            for argument in group_arguments:
-                flags = argument.pop("flags", [])
-                group.add_argument(*flags, **argument)
-
-        # Add the namespaces
+            group = self.add_argument_group(**_without(group_args, "arguments"))
+            for argument in group_args.get("arguments", ()):
+                group.add_argument(
+                    *argument.get("flags", ()),
+                    **_without(argument, "flags"),
+                )
+
+        # Add the namespaces, their arguments are added with the others
+        all_arguments = list(arguments)
         for namespace in namespaces:
-            namespace_arguments = namespace.pop("arguments", [])
-            self.add_namespace(**namespace)
-            arguments.extend(namespace_arguments)
+            all_arguments.extend(namespace.get("arguments", ()))
+            self.add_namespace(**_without(namespace, "arguments"))
 
         # Add the arguments
-        for argument in arguments:
-            flags = argument.pop("flags", [])
-            self.add_argument(*flags, **argument)
+        add_argument = self.add_argument
+        for argument in all_arguments:
+            add_argument(*argument.get("flags", ()), **_without(argument, "flags"))
 
         # Add the commands
         for command_args in commands:
-            command_mutually_exclusive_groups = command_args.pop(
-                "mutually_exclusive_groups",
-                [],
-            )
-            command_groups = command_args.pop("groups", [])
-            command_namespaces = command_args.pop("namespaces", [])
-            command_arguments = command_args.pop("arguments", [])
-            command_commands = command_args.pop("commands", [])
-            command = self.add_command(**command_args)
+            command = self.add_command(**_without(command_args, *_DECEDENT_KEYS))
             command._add_decedents(
-                command_mutually_exclusive_groups,
-                command_groups,
-                command_namespaces,
-                command_arguments,
-                command_commands,
+                *(command_args.get(key, ()) for key in _DECEDENT_KEYS)
             )
 
     def _registry_get(
@@ -555,13 +641,10 @@ class ArgumentParser(APArgumentParser):
     ) -> Any:
         # Allow type to be string
         if registry_name == "type" and isinstance(value, str) and default == value:
-            import builtins
-
-            # "int", "float", "str", "open", etc
-            got = self._registries[registry_name].get(
-                value,
-                getattr(builtins, value, None),
-            )
+            got = self._registries[registry_name].get(value)
+            if got is None:
+                # "int", "float", "str", "open", etc
+                got = getattr(builtins, value, None)
             if not callable(got):
                 raise ValueError(f"Invalid type '{value}'")
 
@@ -592,30 +675,81 @@ class ArgumentParser(APArgumentParser):
         Returns:
             ArgumentParser: The ArgumentParser
         """
-        config = Config.load(*configs)
-        mutually_exclusive_groups = config.pop("mutually_exclusive_groups", [])
-        groups = config.pop("groups", [])
-        namespaces = config.pop("namespaces", [])
-        arguments = config.pop("arguments", [])
-        commands = config.pop("commands", [])
-        if "description" in config:
-            config["description"] = config["description"].format(**kwargs)
-        parser = cls(**config)
-        parser._add_decedents(
-            mutually_exclusive_groups,
-            groups,
-            namespaces,
-            arguments,
-            commands,
-        )
+        config = _load_configs(*configs)
+        parser_args = _without(config, *_DECEDENT_KEYS)
+        if "description" in parser_args:
+            parser_args["description"] = parser_args["description"].format(
+                **kwargs
+            )
+        parser = cls(**parser_args)
+        parser._add_decedents(*(config.get(key, ()) for key in _DECEDENT_KEYS))
         return parser
 
 
-@add_attribute("show", True, "order", 0)
 class _ArgumentGroup(APArgumentGroup):
     _registry_get = ArgumentParser._registry_get
 
+    def __init__(
+        self,
+        container: ArgumentParser | _ArgumentGroup,
+        *args,
+        show: bool = True,
+        order: int = 0,
+        **kwargs,
+    ) -> None:
+        self.show = show
+        self.order = order
+        super().__init__(container, *args, **kwargs)
+        self._dotted_actions: list[Action] = container._dotted_actions
+        self._append_actions: list[
+            AppendAction | AppendConstAction
+        ] = container._append_actions
+
+    def _add_action(self, action: _ActionT) -> _ActionT:
+        """Add an action to the group.
+
+        Modify to keep track of the actions with dotted dests and the append
+        actions.
+        """
+        action = super()._add_action(action)
+        if "." in action.dest:
+            self._dotted_actions.append(action)
+        if isinstance(action, _APPEND_ACTIONS):
+            self._append_actions.append(action)
+        return action
+
+    def _remove_action(self, action: Action) -> None:
+        super()._remove_action(action)
+        if action in self._dotted_actions:
+            self._dotted_actions.remove(action)
+        if action in self._append_actions:
+            self._append_actions.remove(action)
+
+    def add_argument_group(self, *args, **kwargs) -> _ArgumentGroup:
+        """Add a nested argument group to the group.
+
+        Modify to create an argx group, so that the actions with dotted dests
+        added to it are tracked as well.
+        """
+        if sys.version_info >= (3, 11):  # pragma: no cover
+            warnings.warn(
+                "Nesting argument groups is deprecated.",
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+        group = _ArgumentGroup(self, *args, **kwargs)
+        self._action_groups.append(group)
+        return group
+
 
-@add_attribute("name")
 class _NamespaceArgumentGroup(_ArgumentGroup):
-    ...
+
+    def __init__(
+        self,
+        container: ArgumentParser,
+        *args,
+        name: str | None = None,
+        **kwargs,
+    ) -> None:
+        self.name = name
+        super().__init__(container, *args, **kwargs)
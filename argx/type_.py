@@ -1,5 +1,28 @@
 """Additional types for argx"""
-from typing import Any
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Literals recognized by auto()
+_LITERALS = {
+    "True": True,
+    "TRUE": True,
+    "true": True,
+    "False": False,
+    "FALSE": False,
+    "false": False,
+    "None": None,
+    "NONE": None,
+    "none": None,
+}
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+# What int() or float() can accept at most, besides _FLOAT_WORDS
+_NUMBER_LIKE_RE = re.compile(r"\s*[+-]?[\d_.]+(?:[eE][+-]?[\d_]+)?\s*")
+_FLOAT_WORDS = {"inf", "infinity", "nan"}
+# The first characters that a JSON document can start with
+_JSON_STARTS = frozenset('{["-0123456789tfnNI')
 
 
 def py(s: str) -> Any:
@@ -12,23 +35,48 @@ def json(s: str) -> Any:
     return json.loads(s)
 
 
+def path(s: str) -> "Path":
+    # Delay the import, pathlib is not cheap to import
+    from pathlib import Path
+    return Path(s)
+
+
 def auto(s: str) -> Any:
-    if s in ("True", "TRUE", "true"):
-        return True
-    if s in ("False", "FALSE", "false"):
-        return False
-    if s in ("None", "NONE", "none"):
-        return None
+    if isinstance(s, str):
+        if s in _LITERALS:
+            return _LITERALS[s]
+        # Plain numbers, without going through the exceptions below
+        if (s[1:] if s[:1] in "+-" else s).isdecimal():
+            try:
+                return int(s)
+            except ValueError:
+                # Too many digits for int() (Python 3.11+), try float() below
+                pass
+        if _FLOAT_RE.fullmatch(s):
+            return float(s)
+        # Other strings int() or float() may still accept,
+        # like " 1", "1_000", "inf" and "nan"
+        numeric = (
+            _NUMBER_LIKE_RE.fullmatch(s) is not None
+            or s.strip().lstrip("+-").lower() in _FLOAT_WORDS
+        )
+    else:
+        numeric = True
 
-    try:
-        return int(s)
-    except (TypeError, ValueError):
-        pass
+    if numeric:
+        try:
+            return int(s)
+        except (TypeError, ValueError):
+            pass
 
-    try:
-        return float(s)
-    except (TypeError, ValueError):
-        pass
+        try:
+            return float(s)
+        except (TypeError, ValueError):
+            pass
+
+    # Plain words are not JSON, skip the parsing and the exception
+    if isinstance(s, str) and s.lstrip(" \t\n\r")[:1] not in _JSON_STARTS:
+        return s
 
     import json
     try:
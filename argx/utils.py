@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Tuple, Type, TypeVar
 from argparse import Namespace
 
 if TYPE_CHECKING:
@@ -22,13 +24,24 @@ def import_pyfile(pyfile: PathLike | str) -> dict:
         raise AttributeError("No `args` variables found") from None
 
 
+@lru_cache(maxsize=None)
+def split_dest(dest: str) -> Tuple[str, ...]:
+    """Split a dotted dest into keys
+
+    Cached, since the dests of a program are a small, fixed set of strings
+    but are split every time an action is invoked.
+    The keys are interned, as they are used as attribute names of namespaces.
+    """
+    return tuple(sys.intern(key) for key in dest.split("."))
+
+
 def get_ns_dest(namespace: Namespace, dest: str) -> tuple[Namespace, str]:
     """Get the namespace and the last part of the dest to update"""
     if "." not in dest:
         return namespace, dest
 
     # Split the destination into a list of keys
-    keys = dest.split(".")
+    keys = split_dest(dest)
     ns = namespace
     for key in keys[:-1]:
         value = getattr(ns, key, None)
@@ -54,19 +67,12 @@ def copy_items(items: Any) -> Any:  # pragma: no cover
     return copy.copy(items)
 
 
-def add_attribute(
-    attr: str,
-    default: Any = None,
-    attr2: str | None = None,
-    default2: Any = None,
-) -> Callable[[T], T]:
+def add_attribute(attr: str, default: Any = None) -> Callable[[T], T]:
     """Add an attribute to a class, working as a decorator
 
     Args:
         attr: The attribute name
         default: The default value
-        attr2: The second attribute name
-        default2: The second default value
 
     Returns:
         The decorator function
@@ -76,11 +82,7 @@ def add_attribute(
         old_init = cls.__init__
 
         def new_init(self, *args, **kwargs):
-            value = kwargs.pop(attr, default)
-            setattr(self, attr, value)
-            if attr2 is not None:
-                value2 = kwargs.pop(attr2, default2)
-                setattr(self, attr2, value2)
+            setattr(self, attr, kwargs.pop(attr, default))
             return old_init(self, *args, **kwargs)
 
         cls.__init__ = new_init
@@ -89,11 +91,6 @@ def add_attribute(
     return deco
 
 
-def showable(obj: Any) -> bool:
-    """Return True if the object is showable"""
-    return getattr(obj, "show", True)
-
-
 def format_title(title: str) -> str:
     """Format a group title"""
     return ' '.join(map(lambda s: s[0].upper() + s[1:], title.split()))
@@ -1,5 +1,7 @@
+import copy
+
 import pytest  # noqa: F401
-from argx import ArgumentParser
+from argx import ArgumentParser, Namespace
 from argx.action import (
     StoreAction,
     StoreConstAction,
@@ -111,12 +113,76 @@ def test_extend():
     assert ns.bar.v == ["vv"]
 
 
+def test_append_not_modifying_other_lists():
+    parser = ArgumentParser()
+    parser.add_argument("--foo", action="append", default=["a"])
+    parser.add_argument("--bar", action="append", dest="foo")
+    parser.add_argument("--baz", action="append_const", const="z", dest="foo")
+    ns = parser.parse_args(["--bar", "b", "--foo", "c", "--baz", "--bar", "d"])
+    assert ns.foo == ["a", "b", "c", "z", "d"]
+    ns = parser.parse_args(["--foo", "c"])
+    assert ns.foo == ["a", "c"]
+
+    items = ["x"]
+    parser = ArgumentParser()
+    parser.add_argument("--foo", action=ClearAppendAction, default=["a"])
+    parser.add_argument("--bar", nargs="+", action=ClearExtendAction)
+    ns = parser.parse_args(
+        ["--foo", "y", "--bar", "y", "z"],
+        namespace=Namespace(foo=items, bar=items),
+    )
+    assert ns.foo == ["y"]
+    assert ns.bar == ["y", "z"]
+    assert items == ["x"]
+
+    # lists from a previous parse are not modified by the next one
+    parser = ArgumentParser()
+    parser.add_argument("--a", action="append")
+    parser.add_argument("--b", action="append_const", const="c")
+    parser.add_argument("--c", nargs="+", action="extend")
+    parser.add_argument("--d", action=ClearAppendAction)
+    parser.add_argument("--e", nargs="+", action=ClearExtendAction)
+    args = ["--a", "1", "--b", "--c", "1", "--d", "1", "--e", "1"]
+    ns1 = parser.parse_args(args)
+    ns2 = parser.parse_args(args, namespace=copy.copy(ns1))
+    assert ns1.a == ["1"]
+    assert ns1.b == ["c"]
+    assert ns1.c == ["1"]
+    assert ns1.d == ["1"]
+    assert ns1.e == ["1"]
+    assert ns2.a == ["1", "1"]
+    assert ns2.b == ["c", "c"]
+    assert ns2.c == ["1", "1"]
+    assert ns2.d == ["1"]
+    assert ns2.e == ["1"]
+
+
+def test_append_actions_replaced():
+    parser = ArgumentParser(conflict_handler="resolve")
+    group = parser.add_argument_group("group")
+    parser.add_argument("--foo", action="append")
+    group.add_argument("--bar", action=ClearAppendAction)
+    parser.add_argument("--foo", action="append_const", const=1)
+    group.add_argument("--bar", nargs="+", action="extend")
+    assert parser._append_actions == parser._actions[-2:]
+
+    ns = parser.parse_args(["--foo", "--bar", "a", "b"])
+    assert ns.foo == [1]
+    assert ns.bar == ["a", "b"]
+    ns = parser.parse_args(["--foo", "--foo"])
+    assert ns.foo == [1, 1]
+
+
 def test_clear_append():
     parser = ArgumentParser()
     parser.add_argument("--foo", action=ClearAppendAction, default=["a"])
     ns = parser.parse_args(["--foo", "bar", "--foo", "baz"])
     assert ns.foo == ["bar", "baz"]
 
+    # parse again with the same parser
+    ns = parser.parse_args(["--foo", "qux"])
+    assert ns.foo == ["qux"]
+
     parser = ArgumentParser()
     parser.add_argument("--foo", action="append", default=["a"])
     ns = parser.parse_args(["--foo", "bar", "--foo", "baz"])
@@ -136,6 +202,26 @@ def test_clear_append():
     ns = parser.parse_args(["-vvv"])
     assert ns.bar.v == ["vv"]
 
+    # the initial value set by a pre_parse hook is cleared as well
+    def pre_parse(parser, args, namespace):
+        namespace.foo = ["from_hook"]
+        return args
+
+    parser = ArgumentParser(pre_parse=pre_parse)
+    parser.add_argument("--foo", action=ClearAppendAction)
+    ns = parser.parse_args(["--foo", "y"])
+    assert ns.foo == ["y"]
+
+    # values from other actions with the same dest are kept after clearing
+    parser = ArgumentParser()
+    parser.add_argument("--foo", action=ClearAppendAction)
+    parser.add_argument("--bar", nargs="+", action=ClearExtendAction, dest="foo")
+    parser.add_argument("--baz", action="append", dest="foo")
+    ns = parser.parse_args(["--foo", "a", "--baz", "b", "--foo", "c"])
+    assert ns.foo == ["a", "b", "c"]
+    ns = parser.parse_args(["--bar", "a", "--baz", "b", "--bar", "c"])
+    assert ns.foo == ["a", "b", "c"]
+
 
 def test_clear_extend():
     parser = ArgumentParser()
@@ -148,6 +234,10 @@ def test_clear_extend():
     ns = parser.parse_args(["--foo", "bar", "--foo", "baz", "qux"])
     assert ns.foo == ["bar", "baz", "qux"]
 
+    # parse again with the same parser
+    ns = parser.parse_args(["--foo", "quux"])
+    assert ns.foo == ["quux"]
+
     parser = ArgumentParser()
     parser.add_argument(
         "--foo",
@@ -227,6 +317,9 @@ def test_help():
     assert "foo help" in help_str
     help_str = parser.format_help(plus=False)
     assert "foo help" not in help_str
+    assert "--foo" not in help_str
+    help_str = parser.format_help()
+    assert "foo help" in help_str
 
     parser = ArgumentParser(add_help="+")
     parser.add_namespace("ns", show=False)
@@ -234,6 +327,16 @@ def test_help():
     parser.add_argument("--ns.b", action=StoreAction, help="b help")
     help_str = parser.format_help(plus=False)
     assert "'ns'" not in help_str
+    assert "a help" not in help_str
+
+    parser.add_argument("--ns.c", action=StoreAction, help="c help")
+    help_str = parser.format_help(plus=False)
+    assert "a help" not in help_str
+    assert "--ns.c" not in help_str
+    # hidden arguments are not lost after help without plus
+    help_str = parser.format_help()
+    assert "a help" in help_str
+    assert "--ns.c" in help_str
 
 
 def test_help_parse(capsys):
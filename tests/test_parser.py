@@ -1,3 +1,4 @@
+import os
 import pytest  # noqa: F401
 from pathlib import Path
 from argx import ArgumentParser
@@ -66,6 +67,14 @@ def test_load_defaults_from_file():
     assert parsed.ns.v == 2
     assert parsed.ns.vv == 3
 
+    # multiple files are loaded together
+    parser = ArgumentParser(fromfile_prefix_chars="@")
+    parser.add_argument("-a", type=int)
+    parser.add_argument("--ns.v", type=int)
+    parsed = parser.parse_args([f"@{defaultspy}", f"@{defaultsfile}"])
+    assert parsed.a == 1
+    assert parsed.ns.v == 2
+
     bad_defaultspy = Path(__file__).parent / "configs" / "bad_defaults.py"
     parser = ArgumentParser(fromfile_prefix_chars="@")
     parser.add_argument("--ns.v", required=True, type=int)
@@ -90,6 +99,12 @@ def test_load_from_config():
     # The newlines and spaces kept
     assert "                          - newline help" in help_str
 
+    # the loaded configs are not changed for another parser
+    parser = ArgumentParser.from_configs(configfile, name="test_config2")
+    parsed = parser.parse_args("-d -b 2 cmd1 cmd11 -f 1".split())
+    assert parsed.COMMAND2 == "cmd11"
+    assert "test_config2" in parser.format_help()
+
 
 def test_parse_known_args_parse_file_false():
     parser = ArgumentParser(fromfile_prefix_chars="@")
@@ -145,3 +160,208 @@ def test_pre_parse_hook_with_command():
     assert parsed.bar == "1"
     assert parsed.a == "2"
     assert parsed.c == 3
+
+
+def test_formatter_not_shared_for_help():
+    parser = ArgumentParser(prog="prog")
+    parser.add_argument("--foo")
+    parser.add_argument("--bar")
+    usage = parser.format_usage()
+    assert parser.format_usage() == usage
+    assert parser.format_help() == parser.format_help()
+
+
+def test_load_defaults_from_modified_file(tmp_path):
+    defaultsfile = tmp_path / "defaults.toml"
+    defaultsfile.write_text("a = 1\n")
+    parser = ArgumentParser()
+    parser.add_argument("-a", type=int)
+    parser.set_defaults_from_configs(defaultsfile)
+    assert parser.parse_args([]).a == 1
+
+    defaultsfile.write_text("a = 2\n")
+    stat = defaultsfile.stat()
+    os.utime(defaultsfile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    parser.set_defaults_from_configs(defaultsfile)
+    assert parser.parse_args([]).a == 2
+
+    with pytest.raises(FileNotFoundError):
+        parser.set_defaults_from_configs(tmp_path / "nonexist.toml")
+
+    defaultspy = tmp_path / "defaults.py"
+    defaultspy.write_text("args = {'a': 3}\n")
+    parser = ArgumentParser(fromfile_prefix_chars="@")
+    parser.add_argument("-a", type=int)
+    assert parser.parse_args([f"@{defaultspy}"]).a == 3
+
+    defaultspy.write_text("args = {'a': 4}\n")
+    stat = defaultspy.stat()
+    os.utime(defaultspy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert parser.parse_args([f"@{defaultspy}"]).a == 4
+
+    with pytest.raises(SystemExit):
+        parser.parse_args([f"@{tmp_path / 'nonexist.py'}"])
+
+
+def test_load_defaults_from_pyfile_executed_each_time(tmp_path, monkeypatch):
+    defaultspy = tmp_path / "envdefaults.py"
+    defaultspy.write_text("import os\nargs = {'a': int(os.environ['ARGX_A'])}\n")
+    parser = ArgumentParser(fromfile_prefix_chars="@")
+    parser.add_argument("-a", type=int)
+    monkeypatch.setenv("ARGX_A", "1")
+    assert parser.parse_args([f"@{defaultspy}"]).a == 1
+    monkeypatch.setenv("ARGX_A", "2")
+    assert parser.parse_args([f"@{defaultspy}"]).a == 2
+
+
+def test_namespace_options_in_group():
+    parser = ArgumentParser(conflict_handler="resolve")
+    group = parser.add_argument_group("group")
+    group.add_argument("--foo.bar", default=1)
+    parsed = parser.parse_args([])
+    assert parsed.foo.bar == 1
+
+    # replaces the previous one
+    group.add_argument("--foo.bar", default=2)
+    parsed = parser.parse_args([])
+    assert parsed.foo.bar == 2
+
+
+def test_namespace_options_in_nested_group():
+    parser = ArgumentParser()
+    group = parser.add_argument_group("group")
+    inner = group.add_argument_group("inner")
+    inner.add_argument("--ns.a", default=1)
+    inner.add_mutually_exclusive_group().add_argument("--ns.b", default=2)
+    parsed = parser.parse_args([])
+    assert parsed.ns.a == 1
+    assert parsed.ns.b == 2
+
+
+def test_help_with_other_prefix_chars():
+    parser = ArgumentParser(prefix_chars="/", add_help="+")
+    help_str = parser.format_help()
+    assert "/h, //help, /h+, //help+" in help_str
+
+
+def test_parse_args_not_list():
+    parser = ArgumentParser(exit_on_void=True)
+    parser.add_argument("-a", type=int)
+    assert parser.parse_args(("-a", "1")).a == 1
+    assert parser.parse_args(iter(["-a", "2"])).a == 2
+    with pytest.raises(SystemExit):
+        parser.parse_args(iter([]))
+
+
+def test_set_defaults_from_configs_not_a_section():
+    parser = ArgumentParser()
+    parser.add_argument("--ns.a", default=1)
+    parser.add_argument("--ns2.a", default=2)
+    parser.set_defaults_from_configs({"ns": "abc", "ns2": 3})
+    parsed = parser.parse_args([])
+    assert parsed.ns.a == 1
+    assert parsed.ns2.a == 2
+
+
+def test_add_decedents_not_modifying_configs():
+    arguments = [{"flags": ["-a"], "type": "int"}]
+    commands = [
+        {
+            "name": "cmd",
+            "groups": [{"title": "g", "arguments": [{"flags": ["-b"]}]}],
+            "arguments": [{"flags": ["-c"]}],
+        }
+    ]
+    namespaces = [{"name": "ns", "arguments": [{"flags": ["--ns.d"]}]}]
+    for _ in range(2):
+        parser = ArgumentParser()
+        parser._add_decedents([], [], namespaces, arguments, commands)
+        parsed = parser.parse_args("-a 1 --ns.d 2 cmd -b 3 -c 4".split())
+        assert parsed.a == 1
+        assert parsed.ns.d == "2"
+        assert parsed.b == "3"
+        assert parsed.c == "4"
+
+    assert arguments == [{"flags": ["-a"], "type": "int"}]
+    assert commands[0]["groups"][0]["arguments"] == [{"flags": ["-b"]}]
+    assert namespaces == [{"name": "ns", "arguments": [{"flags": ["--ns.d"]}]}]
+
+
+def test_help_default_changed():
+    parser = ArgumentParser()
+    parser.add_argument("--x", help="x help")
+    assert "[default: " not in parser.format_help()
+    parser.set_defaults(x=1)
+    assert "x help [default: 1]" in parser.format_help()
+    assert "x help [default: 1]" in parser.format_help()
+
+
+def test_commands_from_configs():
+    config = {
+        "commands": [
+            {"name": "cmd1", "arguments": [{"flags": ["-a"], "default": 1}]},
+            {
+                "name": "cmd2",
+                "arguments": [{"flags": ["-b"]}],
+                "commands": [
+                    {"name": "cmd21"},
+                    {"name": "cmd22", "arguments": [{"flags": ["-c"]}]},
+                ],
+            },
+        ]
+    }
+    parser = ArgumentParser.from_configs(config)
+    cmd1 = parser._subparsers_action.choices["cmd1"]
+    cmd2 = parser._subparsers_action.choices["cmd2"]
+    cmd22 = cmd2._subparsers_action.choices["cmd22"]
+    assert [action.dest for action in cmd1._actions] == ["help", "a"]
+    assert [action.dest for action in cmd22._actions] == ["help", "c"]
+
+    cmd1.set_defaults(a=5)
+    assert parser.parse_args(["cmd1"]).a == 5
+    parsed = parser.parse_args(["cmd2", "-b", "2", "cmd21"])
+    assert parsed.b == "2"
+
+    parser.set_defaults_from_configs({"cmd1": {"a": 3}, "cmd2": 4})
+    assert cmd1.get_default("a") == 3
+
+    # errors in the configs of commands raise right away
+    config["commands"][0]["arguments"][0]["type"] = "nosuchtype"
+    with pytest.raises(ValueError, match="Invalid type"):
+        ArgumentParser.from_configs(config)
+
+
+def test_parser_reused_for_parses():
+    parser = ArgumentParser()
+    parser.add_argument("-v", action="count", default=0)
+    parser.add_argument("--x", action="append", default=["a"])
+    parser.add_argument("--ns.y", action="append")
+    parser.add_argument("--ns.z", type=int, default=1)
+
+    for _ in range(3):
+        parsed = parser.parse_args(["-vv", "--x", "b", "--ns.y", "c", "--ns.z", "2"])
+        assert parsed.v == 2
+        assert parsed.x == ["a", "b"]
+        assert parsed.ns.y == ["c"]
+        assert parsed.ns.z == 2
+
+        parsed = parser.parse_args([])
+        assert parsed.v == 0
+        assert parsed.x == ["a"]
+        assert parsed.ns.y is None
+        assert parsed.ns.z == 1
+
+
+def test_loaded_configs_not_shared(tmp_path):
+    configfile = tmp_path / "c.toml"
+    configfile.write_text("[ns]\na = 1\n")
+
+    def make_parser():
+        parser = ArgumentParser(fromfile_prefix_chars="@")
+        parser.add_argument("--ns", action="ns")
+        return parser
+
+    parsed = make_parser().parse_args([f"@{configfile}", "--ns", '{"b": 2}'])
+    assert dict(parsed.ns) == {"a": 1, "b": 2}
+    parsed = make_parser().parse_args([f"@{configfile}"])
+    assert dict(parsed.ns) == {"a": 1}
@@ -1,5 +1,9 @@
+import sys
+
 import pytest  # noqa: F401
+from pathlib import Path
 from argx import ArgumentParser
+from argx.type_ import auto
 
 
 def test_py():
@@ -16,6 +20,13 @@ def test_json():
     assert ns.foo == {"a": 1}
 
 
+def test_path():
+    parser = ArgumentParser()
+    parser.add_argument("--foo", type="path")
+    ns = parser.parse_args(["--foo", "a/b"])
+    assert ns.foo == Path("a/b")
+
+
 def test_auto():
     parser = ArgumentParser()
     parser.add_argument("--foo", type="auto")
@@ -34,6 +45,33 @@ def test_auto():
     ns = parser.parse_args(["--foo", 'xy'])
     assert ns.foo == 'xy'
 
+    ns = parser.parse_args(["--foo", '-12'])
+    assert ns.foo == -12
+
+    ns = parser.parse_args(["--foo", '1.5e3'])
+    assert ns.foo == 1500.0
+
+    ns = parser.parse_args(["--foo", '1_000'])
+    assert ns.foo == 1000
+
+    ns = parser.parse_args(["--foo", 'inf'])
+    assert ns.foo == float("inf")
+
+    ns = parser.parse_args(["--foo", '[1, 2]'])
+    assert ns.foo == [1, 2]
+
+    ns = parser.parse_args(["--foo", '1.2.3'])
+    assert ns.foo == '1.2.3'
+
+    assert auto(1) == 1
+
+    # int() limits the number of digits since Python 3.11
+    many_digits = "1" * 5000
+    if hasattr(sys, "get_int_max_str_digits"):
+        assert auto(many_digits) == float("inf")
+    else:  # pragma: no cover
+        assert auto(many_digits) == int(many_digits)
+
 
 def test_unsupported_type():
     parser = ArgumentParser()